@@ -5,35 +5,150 @@ Built on DeepSeek-R1 with Real-time Focus Architecture
 """
 
 import asyncio
+import concurrent.futures
+import itertools
 import json
-import random
 import time
-from datetime import datetime
+
+import numpy as np
 from dotenv import load_dotenv
 import os
-import heapq
+import ahocorasick
 import africastalking
-from transformers import AutoTokenizer, AutoModelForCausalLM
+import torch
+from transformers import (
+    AutoTokenizer,
+    AutoModelForCausalLM,
+    BitsAndBytesConfig,
+    StoppingCriteria,
+    StoppingCriteriaList
+)
 
 # Load environment variables
 load_dotenv()
 
+# Inference worker state, populated by _load_model inside the dedicated
+# subprocess so the parent's event loop never shares a GIL with
+# tokenization and decoding
+_WORKER_TOKENIZER = None
+_WORKER_MODEL = None
+_WORKER_DRAFT_MODEL = None
+
+
+def _load_model():
+    """Load tokenizer and models once in the inference subprocess"""
+    global _WORKER_TOKENIZER, _WORKER_MODEL, _WORKER_DRAFT_MODEL
+
+    tokenizer = AutoTokenizer.from_pretrained("deepseek-ai/deepseek-r1")
+    # Left padding so batched prompts line up at the generation end
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    tokenizer.padding_side = "left"
+
+    # 8-bit weights halve the bytes streamed from memory per generated
+    # token, the dominant cost at our small batch sizes
+    model = AutoModelForCausalLM.from_pretrained(
+        "deepseek-ai/deepseek-r1",
+        device_map="auto",
+        quantization_config=BitsAndBytesConfig(load_in_8bit=True)
+    )
+    model.eval()
+    # Compiled decode step replays one captured graph per token instead
+    # of launching thousands of individual kernels
+    model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+
+    # Small draft model for speculative decoding: it proposes candidate
+    # tokens that the big model verifies in one pass
+    draft_model = AutoModelForCausalLM.from_pretrained(
+        "DeepSeek-R1-DRAFT-Qwen2.5-0.5B",
+        device_map="auto",
+        torch_dtype=torch.bfloat16
+    )
+    draft_model.eval()
+
+    _WORKER_TOKENIZER = tokenizer
+    _WORKER_MODEL = model
+    _WORKER_DRAFT_MODEL = draft_model
+
+
+def _infer(prompts):
+    """Tokenize, generate, and decode a batch of prompts in the worker"""
+    inputs = _WORKER_TOKENIZER(prompts, return_tensors="pt", padding=True).to(_WORKER_MODEL.device)
+
+    # Alerts are read out over voice calls, so cap output short, decode
+    # greedily, and stop at the first sentence break after 30 tokens
+    kwargs = {
+        "max_new_tokens": 80,
+        "do_sample": False,
+        "use_cache": True,
+        "eos_token_id": _WORKER_TOKENIZER.eos_token_id,
+        "pad_token_id": _WORKER_TOKENIZER.eos_token_id,
+        "stopping_criteria": StoppingCriteriaList(
+            [SentenceStop(_WORKER_TOKENIZER, inputs["input_ids"].shape[1])]
+        )
+    }
+    # Assisted generation only supports a single sequence; batched
+    # bursts already amortize their cost without the draft model
+    if inputs["input_ids"].shape[0] == 1:
+        kwargs["assistant_model"] = _WORKER_DRAFT_MODEL
+    with torch.inference_mode():
+        outputs = _WORKER_MODEL.generate(**inputs, **kwargs)
+
+    responses = _WORKER_TOKENIZER.batch_decode(outputs, skip_special_tokens=True)
+    return [resp.replace(prompt, "").strip() for prompt, resp in zip(prompts, responses)]
+
+
+class SentenceStop(StoppingCriteria):
+    """Stop generation at the first sentence break once enough tokens exist"""
+    def __init__(self, tokenizer, input_len, min_new_tokens=30):
+        self.tokenizer = tokenizer
+        self.input_len = input_len
+        self.min_new_tokens = min_new_tokens
+
+    def __call__(self, input_ids, scores, **kwargs):
+        if input_ids.shape[1] - self.input_len < self.min_new_tokens:
+            return False
+        last_tokens = self.tokenizer.batch_decode(input_ids[:, -1:])
+        return all("." in tok or "\n" in tok for tok in last_tokens)
+
+
 class PriorityEventQueue:
     """Priority queue for event handling (1 = highest priority)"""
     def __init__(self):
-        self._queue = []
-        self._event_available = asyncio.Event()
-    
+        # asyncio's native priority queue handles producer/consumer
+        # signaling race-free, replacing the manual Event set/clear loop
+        self._queue = asyncio.PriorityQueue()
+        self._counter = itertools.count()
+
     def put(self, priority, event):
-        heapq.heappush(self._queue, (priority, time.time(), event))
-        self._event_available.set()
-    
+        # Unique counter breaks priority ties so the event dicts are never
+        # compared (equal timestamps would fall through to the payload)
+        self._queue.put_nowait((priority, next(self._counter), event))
+
     async def get(self):
-        while not self._queue:
-            await self._event_available.wait()
-            self._event_available.clear()
-        
-        return heapq.heappop(self._queue)[2]  # Return just the event
+        return (await self._queue.get())[2]  # Return just the event
+
+    def drain_up_to(self, k):
+        """Pop up to k pending events without blocking, best-priority first"""
+        events = []
+        while len(events) < k:
+            try:
+                events.append(self._queue.get_nowait()[2])
+            except asyncio.QueueEmpty:
+                break
+        return events
+
+    def qsize(self):
+        return self._queue.qsize()
+
+class PairState:
+    """Per-pair alert bookkeeping; hot numeric state lives in the SoA arrays"""
+    __slots__ = ("index", "last_alert")
+
+    def __init__(self, index):
+        self.index = index
+        self.last_alert = 0
+
 
 class ForexAgent:
     EVENT_PRIORITIES = {
@@ -43,21 +158,45 @@ class ForexAgent:
         "news": 3,
         "status_update": 4
     }
-    
+
+    HISTORY_SIZE = 100       # Ring buffer capacity per pair
+    VOLATILITY_WINDOW = 20   # Trailing prices used for volatility
+    MAX_BATCH_SIZE = 8       # Events analyzed per LLM forward pass
+
+    # Prompt templates are parsed once at class creation; event handlers
+    # only fill in the fields
+    PRICE_PROMPT = (
+        "Generate urgent Forex trading alert. Currency pair: {pair}. "
+        "Price movement: {change:.2f}% in last minute. "
+        "Current price: {price:.4f}. Volatility: {volatility:.4f}. "
+        "Provide concise analysis and recommendation:"
+    )
+    NEWS_PROMPT = (
+        "Generate breaking Forex news alert. Currency pair: {pair}. "
+        "Headline: '{headline}'. "
+        "Analyze potential market impact and provide trading recommendation:"
+    )
+
     def __init__(self):
+        # Snapshot credentials once; os.environ lookups are slow and the
+        # values never change after startup
+        self._at_username = os.getenv('AFRICASTALKING_USERNAME')
+        self._at_api_key = os.getenv('AFRICASTALKING_API_KEY')
+        self._phone_number = os.getenv('YOUR_PHONE_NUMBER')
+        self._virtual_number = os.getenv('AFRICASTALKING_VIRTUAL_NUMBER', '+254711XXXYYY')
+        self._at_configured = all([self._at_username, self._at_api_key, self._phone_number])
+
         # Initialize Africa's Talking SDK
         africastalking.initialize(
-            username=os.getenv('AFRICASTALKING_USERNAME'),
-            api_key=os.getenv('AFRICASTALKING_API_KEY')
+            username=self._at_username,
+            api_key=self._at_api_key
         )
         self.voice = africastalking.Voice
         
-        # Initialize AI model
-        self.tokenizer = AutoTokenizer.from_pretrained("deepseek-ai/deepseek-r1")
-        self.model = AutoModelForCausalLM.from_pretrained(
-            "deepseek-ai/deepseek-r1",
-            device_map="auto",
-            torch_dtype="auto"
+        # AI inference runs in a dedicated subprocess so tokenization and
+        # decoding never hold this process's GIL while the market ticks
+        self.inference_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, initializer=_load_model
         )
         
         # State tracking
@@ -65,7 +204,16 @@ class ForexAgent:
         self.last_alert_time = 0
         self.event_queue = PriorityEventQueue()
         self.active_events = {}
-        self.resource_lock = asyncio.Lock()
+        # Separate locks: one keeps LLM inference single-flight, the other
+        # serializes alert dispatch, so neither waits on the other
+        self.alert_lock = asyncio.Lock()
+        self._llm_lock = asyncio.Lock()
+        self._market_hours_ts = -1
+        self._market_hours_val = False
+        # Bit per UTC hour (bit 0 = 00:00). The overlapping Asian/European/
+        # US sessions cover hours 0-21, leaving only 22-23 quiet; flip bits
+        # here to edit the session schedule
+        self._market_hours_mask = 0b0011_1111_1111_1111_1111_1111
         
         # Configuration
         self.monitored_pairs = ["EUR/USD", "USD/JPY", "GBP/USD", "AUD/USD", "USD/KES"]
@@ -73,66 +221,93 @@ class ForexAgent:
             "emergency_price": 1.5,  # Percentage change
             "price_spike": 0.8       # Percentage change
         }
+        self.alert_cooldown = 300    # Seconds between alerts per pair
         self.news_keywords = ["interest rate", "inflation", "policy", "crisis", "war"]
-        
-        # Initialize market state
-        for pair in self.monitored_pairs:
-            self.market_state[pair] = {
-                "price": random.uniform(0.8, 1.2),
-                "last_alert": 0,
-                "volatility": 0.1,
-                "history": []
-            }
+        self.breaking_keywords = {"emergency", "crisis", "war", "disaster"}
+        # One automaton scans a headline in a single pass regardless of
+        # how many keywords are configured
+        self.keyword_automaton = ahocorasick.Automaton()
+        for keyword in set(self.news_keywords) | self.breaking_keywords:
+            self.keyword_automaton.add_word(keyword, keyword)
+        self.keyword_automaton.make_automaton()
+
+        # Initialize market state as structure-of-arrays: one slot per pair,
+        # so each tick is a handful of vectorized NumPy ops instead of a
+        # Python loop over pairs
+        num_pairs = len(self.monitored_pairs)
+        self.pair_index = {pair: i for i, pair in enumerate(self.monitored_pairs)}
+        self.rng = np.random.default_rng()
+        self.prices = self.rng.uniform(0.8, 1.2, num_pairs)
+        self.volatility = np.full(num_pairs, 0.1)
+        self.price_history = np.zeros((num_pairs, self.HISTORY_SIZE))
+        # One timestamp per tick; all pairs are written together, so a
+        # single parallel buffer replaces the old per-entry dict field
+        self.ts_history = np.zeros(self.HISTORY_SIZE)
+        self.hist_head = 0
+        self.hist_len = 0
+        # Running sums over the volatility window so each tick updates the
+        # statistics in O(1) instead of recomputing over the whole window
+        self.vol_sum = np.zeros(num_pairs)
+        self.vol_sumsq = np.zeros(num_pairs)
+        self.vol_count = 0
+        for pair, index in self.pair_index.items():
+            self.market_state[pair] = PairState(index)
 
     async def market_data_stream(self):
         """Simulated real-time market data stream"""
+        num_pairs = len(self.monitored_pairs)
         while True:
-            # Update prices with random walk
-            for pair in self.monitored_pairs:
-                state = self.market_state[pair]
-                last_price = state["price"]
-                
-                # Generate normal price movement
-                change = random.uniform(-0.003, 0.003)
-                new_price = last_price * (1 + change)
-                
-                # Occasionally create significant events
-                if random.random() < 0.05:  # 5% chance of event
-                    movement = random.choice([-1, 1]) * random.uniform(0.01, 0.05)
-                    new_price = last_price * (1 + movement)
-                    change = movement
-                
-                # Update state
-                state["price"] = new_price
-                state["history"].append({
-                    "price": new_price,
-                    "timestamp": time.time()
-                })
-                
-                # Trim history
-                if len(state["history"]) > 100:
-                    state["history"] = state["history"][-50:]
-                
-                # Calculate and store volatility
-                prices = [h["price"] for h in state["history"][-20:]]
-                mean_price = sum(prices) / len(prices)
-                state["volatility"] = (sum((p - mean_price)**2 for p in prices) / len(prices)) ** 0.5
-                
-                # Detect significant movements
-                abs_change = abs(change * 100)
-                event_type = None
-                
-                if abs_change > self.alert_thresholds["emergency_price"]:
+            # One clock read per tick; monotonic is cheaper than wall time
+            # and immune to NTP steps
+            now = time.monotonic()
+
+            # Update all pairs at once with a vectorized random walk
+            changes = self.rng.uniform(-0.003, 0.003, num_pairs)
+
+            # Occasionally create significant events (5% chance per pair)
+            event_mask = self.rng.random(num_pairs) < 0.05
+            movements = self.rng.choice([-1.0, 1.0], num_pairs) * self.rng.uniform(0.01, 0.05, num_pairs)
+            changes = np.where(event_mask, movements, changes)
+
+            # Update prices and the history ring buffer, retiring the price
+            # that drops out of the volatility window from the running sums
+            self.prices *= 1 + changes
+            if self.vol_count == self.VOLATILITY_WINDOW:
+                oldest = self.price_history[:, (self.hist_head - self.VOLATILITY_WINDOW) % self.HISTORY_SIZE]
+                self.vol_sum -= oldest
+                self.vol_sumsq -= oldest * oldest
+            else:
+                self.vol_count += 1
+            self.price_history[:, self.hist_head] = self.prices
+            self.ts_history[self.hist_head] = now
+            self.vol_sum += self.prices
+            self.vol_sumsq += self.prices * self.prices
+            self.hist_head = (self.hist_head + 1) % self.HISTORY_SIZE
+            self.hist_len = min(self.hist_len + 1, self.HISTORY_SIZE)
+
+            # Volatility from the running sums: var = E[x^2] - E[x]^2
+            mean = self.vol_sum / self.vol_count
+            variance = self.vol_sumsq / self.vol_count - mean * mean
+            self.volatility = np.sqrt(np.maximum(variance, 0.0))
+
+            # Detect significant movements
+            abs_changes = np.abs(changes) * 100
+            for i in np.where(abs_changes > self.alert_thresholds["price_spike"])[0]:
+                if abs_changes[i] > self.alert_thresholds["emergency_price"]:
                     event_type = "emergency_price"
-                elif abs_change > self.alert_thresholds["price_spike"]:
+                else:
                     event_type = "price_spike"
-                
-                if event_type:
-                    self.event_queue.put(
-                        self.EVENT_PRIORITIES[event_type],
-                        {"type": "price", "pair": pair, "change": change*100, "price": new_price}
-                    )
-            
+
+                self.event_queue.put(
+                    self.EVENT_PRIORITIES[event_type],
+                    {
+                        "type": "price",
+                        "pair": self.monitored_pairs[i],
+                        "change": changes[i] * 100,
+                        "price": self.prices[i]
+                    }
+                )
+
             await asyncio.sleep(0.5)  # Fast market updates
 
     async def news_monitor(self):
@@ -151,13 +326,16 @@ class ForexAgent:
         
         while True:
             # Simulate news events
-            if random.random() < 0.02:  # 2% chance of news
-                headline, pair = random.choice(sample_news)
+            if self.rng.random() < 0.02:  # 2% chance of news
+                headline, pair = sample_news[self.rng.integers(len(sample_news))]
                 
-                # Determine priority
-                priority = self.EVENT_PRIORITIES["breaking_news"] if any(
-                    kw in headline.lower() for kw in ["emergency", "crisis", "war", "disaster"]
-                ) else self.EVENT_PRIORITIES["news"]
+                # Determine priority from one automaton pass over the headline
+                matched = {kw for _, kw in self.keyword_automaton.iter(headline.lower())}
+                priority = (
+                    self.EVENT_PRIORITIES["breaking_news"]
+                    if matched & self.breaking_keywords
+                    else self.EVENT_PRIORITIES["news"]
+                )
                 
                 self.event_queue.put(
                     priority,
@@ -170,76 +348,58 @@ class ForexAgent:
         """Core event processing with dedicated resource allocation"""
         print("🔄 Event processor started - waiting for events")
         while True:
-            event = await self.event_queue.get()
-            print(f"\n⚡ EVENT RECEIVED [{event['type']}] for {event.get('pair', '')}")
-            
-            # Dedicate full resources to event
-            async with self.resource_lock:
-                if event["type"] == "price":
-                    await self.handle_price_event(event)
-                elif event["type"] == "news":
-                    await self.handle_news_event(event)
-            
+            # Gather a burst of pending events so one LLM forward pass
+            # amortizes weight bandwidth across all of them; drain order is
+            # best-priority first, so the top event is dispatched first
+            events = [await self.event_queue.get()]
+            events += self.event_queue.drain_up_to(self.MAX_BATCH_SIZE - 1)
+            for event in events:
+                print(f"\n⚡ EVENT RECEIVED [{event['type']}] for {event.get('pair', '')}")
+
+            prompts = [self.build_event_prompt(event) for event in events]
+            analyses = await self.generate_ai_responses(prompts)
+            for event, analysis in zip(events, analyses):
+                await self.dispatch_event_alert(event, analysis)
+
             # Add slight delay to prevent resource starvation
             await asyncio.sleep(0.1)
 
-    async def handle_price_event(self, event):
-        """Focused price event analysis"""
-        pair = event["pair"]
-        state = self.market_state[pair]
-        
-        # Generate AI analysis
-        prompt = (
-            f"Generate urgent Forex trading alert. Currency pair: {pair}. "
-            f"Price movement: {event['change']:.2f}% in last minute. "
-            f"Current price: {event['price']:.4f}. Volatility: {state['volatility']:.4f}. "
-            "Provide concise analysis and recommendation:"
-        )
-        
-        analysis = await self.generate_ai_response(prompt)
-        await self.maybe_trigger_alert(
-            f"{pair} PRICE MOVEMENT: {abs(event['change']):.2f}%",
-            analysis,
-            pair
-        )
+    def build_event_prompt(self, event):
+        """Build the analysis prompt for a price or news event"""
+        if event["type"] == "price":
+            pair = event["pair"]
+            return self.PRICE_PROMPT.format(
+                pair=pair,
+                change=event["change"],
+                price=event["price"],
+                volatility=self.volatility[self.pair_index[pair]]
+            )
+        return self.NEWS_PROMPT.format(pair=event["pair"], headline=event["headline"])
 
-    async def handle_news_event(self, event):
-        """Focused news event analysis"""
-        # Generate AI analysis
-        prompt = (
-            f"Generate breaking Forex news alert. Currency pair: {event['pair']}. "
-            f"Headline: '{event['headline']}'. "
-            "Analyze potential market impact and provide trading recommendation:"
-        )
-        
-        analysis = await self.generate_ai_response(prompt)
-        await self.maybe_trigger_alert(
-            f"{event['pair']} NEWS: {event['headline'][:30]}...",
-            analysis,
-            event["pair"]
-        )
+    async def dispatch_event_alert(self, event, analysis):
+        """Route a finished analysis to the alert system"""
+        if event["type"] == "price":
+            title = f"{event['pair']} PRICE MOVEMENT: {abs(event['change']):.2f}%"
+        else:
+            title = f"{event['pair']} NEWS: {event['headline'][:30]}..."
+        await self.maybe_trigger_alert(title, analysis, event["pair"])
 
-    async def generate_ai_response(self, prompt):
-        """Generate response using DeepSeek-R1 with async optimization"""
-        inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
-        
-        # Run generation in thread to avoid blocking event loop
+    async def generate_ai_responses(self, prompts):
+        """Generate responses for a batch of prompts in one forward pass"""
+        # Only the prompt strings cross the process boundary; the LLM lock
+        # keeps inference single-flight without stalling alert dispatch
         loop = asyncio.get_running_loop()
-        outputs = await loop.run_in_executor(
-            None, 
-            lambda: self.model.generate(**inputs, max_new_tokens=150, temperature=0.7)
-        )
-        
-        full_response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-        return full_response.replace(prompt, "").strip()
+        async with self._llm_lock:
+            return await loop.run_in_executor(self.inference_executor, _infer, prompts)
 
     async def maybe_trigger_alert(self, title, message, pair):
         """Smart alert triggering with rate limiting"""
-        now = time.time()
+        # Monotonic deltas keep the cooldown robust to wall-clock jumps
+        now = time.monotonic()
         state = self.market_state[pair]
-        
-        # Apply rate limiting per pair
-        if now - state["last_alert"] < 300:  # 5 minutes cooldown per pair
+
+        # Apply rate limiting per pair (last_alert of 0 means never alerted)
+        if state.last_alert and now - state.last_alert < self.alert_cooldown:
             print(f"⏳ Cooldown active for {pair} - suppressing alert")
             return
         
@@ -252,31 +412,45 @@ class ForexAgent:
         print(f"📢 {message}")
         
         # Only call if Africa's Talking is configured
-        if not all([os.getenv("AFRICASTALKING_USERNAME"), os.getenv("AFRICASTALKING_API_KEY"), os.getenv("YOUR_PHONE_NUMBER")]):
+        if not self._at_configured:
             print("⚠️ Africa's Talking not configured - skipping call")
             return
         
         try:
-            # Create phone call
-            response = self.voice.call(
-                callFrom=os.getenv("AFRICASTALKING_VIRTUAL_NUMBER", "+254711XXXYYY"),
-                callTo=[os.getenv('YOUR_PHONE_NUMBER')]
-            )
-            
+            # Create phone call; only the dispatch itself needs the lock.
+            # The SDK blocks on requests, so run it in a thread to keep
+            # the market tick on time while the call is in flight
+            loop = asyncio.get_running_loop()
+            async with self.alert_lock:
+                response = await loop.run_in_executor(
+                    None,
+                    lambda: self.voice.call(
+                        callFrom=self._virtual_number,
+                        callTo=[self._phone_number]
+                    )
+                )
+
             # Extract call ID from response
             call_id = response['entries'][0]['callId'] if 'entries' in response else 'N/A'
             print(f"📞 Call initiated: ID={call_id}")
-            
-            state["last_alert"] = now
+
+            state.last_alert = now
             self.last_alert_time = now
         except Exception as e:
             print(f"❌ Africa's Talking error: {str(e)}")
 
     def is_market_hours(self):
         """Check if it's Forex market hours (24/5 but prioritize active sessions)"""
-        hour = datetime.utcnow().hour
-        # Asian: 23-8 UTC, European: 7-16 UTC, US: 12-21 UTC
-        return (0 <= hour < 8) or (7 <= hour < 17) or (12 <= hour < 22)
+        # Cached at one-second granularity; alert bursts skip the clock
+        # conversion entirely
+        ts = int(time.time())
+        if ts == self._market_hours_ts:
+            return self._market_hours_val
+        self._market_hours_ts = ts
+        self._market_hours_val = bool(
+            (self._market_hours_mask >> time.gmtime(ts).tm_hour) & 1
+        )
+        return self._market_hours_val
 
     async def system_monitor(self):
         """Periodic system health checks"""
@@ -284,17 +458,22 @@ class ForexAgent:
             await asyncio.sleep(60)
             print("\n🖥️ SYSTEM STATUS")
             print(f"Monitored pairs: {', '.join(self.monitored_pairs)}")
-            print(f"Queue depth: {len(self.event_queue._queue)}")
+            print(f"Queue depth: {self.event_queue.qsize()}")
             print(f"Latest alerts:")
             for pair in self.monitored_pairs:
                 state = self.market_state[pair]
-                last_alert = state["last_alert"]
-                alert_status = f"{int(time.time() - last_alert)}s ago" if last_alert > 0 else "Never"
-                print(f"  {pair}: {state['price']:.4f} | Last alert: {alert_status}")
+                alert_status = f"{int(time.monotonic() - state.last_alert)}s ago" if state.last_alert > 0 else "Never"
+                print(f"  {pair}: {self.prices[state.index]:.4f} | Last alert: {alert_status}")
+
+    async def _warmup_model(self):
+        """Pay the model-load and torch.compile cost before events flow"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.inference_executor, _infer, ["Warmup prompt:"])
 
     async def run(self):
         """Start the agent system"""
         print("🚀 Starting Advanced Forex Agent with Africa's Talking")
+        await self._warmup_model()
         print(f"🔍 Monitoring: {', '.join(self.monitored_pairs)}")
         print(f"⏱️ Market hours: {'Active' if self.is_market_hours() else 'Check UTC schedule'}")
         